@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Convert markdown files or saved Notion block JSON into native Notion blocks,
+streamed to stdout as NDJSON (one block per line).
+
+No NOTION_TOKEN and no network access are needed, so the output can be piped,
+split and parallelized with ordinary tools before uploading, e.g.:
+
+  python3 scripts/convert-to-notion-blocks.py docs/*.md | split -l 100 - batch-
+
+Inputs:
+  *.md                  markdown source (notion_blocks.parse_markdown rules)
+  *.json / *.ndjson     saved Notion blocks (notion_blocks.parse_page_blocks rules):
+                        a JSON array, an API response with "results",
+                        or one block per line
+  -                     stdin (default when no input is given)
+
+Usage:
+  python3 scripts/convert-to-notion-blocks.py [--from {auto,markdown,blocks}] [INPUT ...]
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from notion_blocks import iter_markdown_blocks, iter_page_blocks
+
+
+# ─── Input Readers ───
+
+
+def unwrap_blocks(obj):
+    """Yield blocks from a JSON value: a block, a list of blocks or an API response."""
+    if isinstance(obj, list):
+        items = obj
+    elif isinstance(obj, dict) and "results" in obj:
+        items = obj["results"]
+    elif isinstance(obj, dict):
+        items = [obj]
+    else:
+        raise ValueError(f"Unsupported block JSON value: {type(obj).__name__}")
+
+    for item in items:
+        if not isinstance(item, dict) or "type" not in item:
+            raise ValueError(f"Not a Notion block: {json.dumps(item, ensure_ascii=False)[:100]}")
+        yield item
+
+
+def iter_json_blocks(f):
+    """Yield raw Notion blocks from a file object.
+
+    One block (or response page) per line is read incrementally; anything
+    else is loaded as a single JSON document.
+    """
+    first = ""
+    for line in f:
+        if line.strip():
+            first = line
+            break
+    if not first:
+        return
+
+    try:
+        obj = json.loads(first)
+    except ValueError:
+        # Pretty-printed document spanning several lines
+        yield from unwrap_blocks(json.loads(first + f.read()))
+        return
+
+    yield from unwrap_blocks(obj)
+    for line in f:
+        if line.strip():
+            yield from unwrap_blocks(json.loads(line))
+
+
+def detect_format(path, default):
+    """Pick 'markdown' or 'blocks' for an input path."""
+    if default != "auto":
+        return default
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".json", ".ndjson", ".jsonl"):
+        return "blocks"
+    if ext in (".md", ".markdown"):
+        return "markdown"
+    # stdin and unknown extensions default to markdown
+    return "markdown"
+
+
+def iter_input_blocks(path, fmt):
+    """Yield converted blocks for a single input path ('-' for stdin)."""
+    f = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        if fmt == "blocks":
+            yield from iter_page_blocks(iter_json_blocks(f))
+        else:
+            yield from iter_markdown_blocks(f)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+# ─── Main Processing ───
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert markdown / Notion block JSON to Notion blocks (NDJSON)")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="Input files ('-' for stdin)")
+    parser.add_argument("--from", dest="fmt", choices=("auto", "markdown", "blocks"), default="auto",
+                        help="Input format (auto: by file extension, stdin is markdown)")
+    args = parser.parse_args()
+
+    total = 0
+    try:
+        for path in args.inputs:
+            fmt = detect_format(path, args.fmt)
+            count = 0
+            for block in iter_input_blocks(path, fmt):
+                sys.stdout.write(json.dumps(block, ensure_ascii=False, separators=(",", ":")) + "\n")
+                sys.stdout.flush()
+                count += 1
+            print(f"{path}: {count} blocks ({fmt})", file=sys.stderr)
+            total += count
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); stop quietly
+        sys.stderr.close()
+        os._exit(0)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Total: {total} blocks", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
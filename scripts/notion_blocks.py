@@ -0,0 +1,292 @@
+"""
+Markdown / Notion block → native Notion block conversion, shared by the
+scripts in this directory.
+
+No NOTION_TOKEN or network access is needed to import this module.
+"""
+
+import re
+
+
+# ─── Rich Text Parser ───
+
+
+def parse_inline_formatting(text_str):
+    """Parse inline markdown formatting to Notion rich text array.
+
+    Handles:
+    - `code` → code annotation
+    - [link text](url) → link
+    - Regular text
+    """
+    if not text_str or not text_str.strip():
+        return [rt_text("")]
+
+    rich_texts = []
+    # Pattern to match `code` or [text](url)
+    pattern = r'(`[^`]+`|\[[^\]]*\]\([^)]+\))'
+    parts = re.split(pattern, text_str)
+
+    for part in parts:
+        if not part:
+            continue
+        if part.startswith("`") and part.endswith("`"):
+            # Code span
+            code_content = part[1:-1]
+            rich_texts.append(rt_text(code_content, code=True))
+        elif re.match(r'\[([^\]]*)\]\(([^)]+)\)', part):
+            # Markdown link - only create link if URL is valid (http/https)
+            m = re.match(r'\[([^\]]*)\]\(([^)]+)\)', part)
+            url = m.group(2)
+            if url.startswith(("http://", "https://")):
+                rich_texts.append(rt_text(m.group(1), link=url))
+            else:
+                # Relative path or invalid URL - render as plain text
+                rich_texts.append(rt_text(m.group(1)))
+        else:
+            rich_texts.append(rt_text(part))
+
+    return rich_texts if rich_texts else [rt_text("")]
+
+
+def rt_text(content, bold=False, code=False, link=None):
+    """Create a single rich text element."""
+    rt = {"type": "text", "text": {"content": content}}
+    if link:
+        rt["text"]["link"] = {"url": link}
+    annotations = {}
+    if bold:
+        annotations["bold"] = True
+    if code:
+        annotations["code"] = True
+    if annotations:
+        rt["annotations"] = annotations
+    return rt
+
+
+# ─── Block Builders ───
+
+
+def heading1(title):
+    return {"type": "heading_1", "heading_1": {"rich_text": [rt_text(title)]}}
+
+
+def heading2(title):
+    return {"type": "heading_2", "heading_2": {"rich_text": [rt_text(title)]}}
+
+
+def heading3(title):
+    return {"type": "heading_3", "heading_3": {"rich_text": [rt_text(title)]}}
+
+
+def divider():
+    return {"type": "divider", "divider": {}}
+
+
+def paragraph(rich_texts):
+    return {"type": "paragraph", "paragraph": {"rich_text": rich_texts}}
+
+
+def bullet_item(rich_texts):
+    return {"type": "bulleted_list_item", "bulleted_list_item": {"rich_text": rich_texts}}
+
+
+def make_table(rows):
+    """Create a table block from parsed rows.
+    Each row is a list of cell strings (raw markdown text).
+    First row is treated as header.
+    """
+    if not rows or len(rows) < 1:
+        return None
+
+    width = len(rows[0])
+    table_rows = []
+    for row in rows:
+        cells = []
+        for cell_text in row:
+            cell_text = cell_text.strip()
+            rich_texts = parse_inline_formatting(cell_text)
+            cells.append(rich_texts)
+        # Pad or trim to match width
+        while len(cells) < width:
+            cells.append([rt_text("")])
+        cells = cells[:width]
+        table_rows.append({"type": "table_row", "table_row": {"cells": cells}})
+
+    return {
+        "type": "table",
+        "table": {
+            "table_width": width,
+            "has_column_header": True,
+            "has_row_header": False,
+            "children": table_rows,
+        },
+    }
+
+
+# ─── Content Parser ───
+
+
+def extract_plain_text(block):
+    """Extract plain text from a block's rich_text array."""
+    btype = block["type"]
+    rt_list = block.get(btype, {}).get("rich_text", [])
+    return "".join(t.get("plain_text", "") for t in rt_list)
+
+
+def parse_table_row(line):
+    """Parse a markdown table row '| col1 | col2 | col3 |' into list of cell strings."""
+    line = line.strip()
+    if not line.startswith("|"):
+        return None
+    # Split by |, remove first/last empty elements
+    parts = line.split("|")
+    # Remove leading/trailing empty strings from split
+    if parts and parts[0].strip() == "":
+        parts = parts[1:]
+    if parts and parts[-1].strip() == "":
+        parts = parts[:-1]
+    return [p.strip() for p in parts]
+
+
+def is_separator_row(cells):
+    """Check if a row is a markdown table separator (| --- | --- |)."""
+    return all(re.match(r'^:?-+:?$', c.strip()) for c in cells if c.strip())
+
+
+def iter_markdown_blocks(lines):
+    """Yield Notion blocks from markdown lines as soon as each one is complete.
+
+    Only the rows of the table currently being read are held in memory.
+    """
+    table_rows = []
+    in_table = False
+
+    for raw in lines:
+        line = raw.rstrip()
+
+        # Table: keep collecting consecutive rows
+        if line.strip().startswith("|"):
+            in_table = True
+            cells = parse_table_row(line)
+            if cells and not is_separator_row(cells):
+                table_rows.append(cells)
+            continue
+
+        if in_table:
+            tbl = make_table(table_rows)
+            if tbl:
+                yield tbl
+            table_rows = []
+            in_table = False
+
+        # Skip empty lines
+        if not line.strip():
+            continue
+
+        # Headings
+        if line.startswith("# "):
+            # Skip h1 (page title)
+            continue
+        if line.startswith("### "):
+            yield heading3(line[4:].strip())
+            continue
+        if line.startswith("## "):
+            yield heading1(line[3:].strip())
+            continue
+
+        # Horizontal rule
+        if line.strip() == "---":
+            yield divider()
+            continue
+
+        # Bullet list
+        if line.strip().startswith("- "):
+            yield bullet_item(parse_inline_formatting(line.strip()[2:]))
+            continue
+
+        # Regular paragraph
+        yield paragraph(parse_inline_formatting(line.strip()))
+
+    if in_table:
+        tbl = make_table(table_rows)
+        if tbl:
+            yield tbl
+
+
+def iter_page_blocks(blocks):
+    """Yield formatted blocks from raw Notion blocks as soon as each one is complete."""
+    table_rows = []
+    in_table = False
+
+    for block in blocks:
+        btype = block["type"]
+        text = extract_plain_text(block) if btype in ("paragraph", "bulleted_list_item") else ""
+
+        # Markdown table row: keep collecting consecutive paragraphs.
+        # A decorative title is skipped rather than starting a table.
+        if btype == "paragraph" and text.strip().startswith("|") and (in_table or "━━━" not in text):
+            cells = parse_table_row(text)
+            if cells is not None:
+                in_table = True
+                if not is_separator_row(cells):
+                    table_rows.append(cells)
+                continue
+
+        if in_table:
+            tbl = make_table(table_rows)
+            if tbl:
+                yield tbl
+            table_rows = []
+            in_table = False
+
+        if btype == "paragraph":
+            # Skip empty paragraphs
+            if not text.strip():
+                continue
+
+            # Decorative title: ━━━ タイトル ━━━
+            if "━━━" in text:
+                continue
+
+            # Horizontal rule: ---
+            if text.strip() == "---":
+                yield divider()
+                continue
+
+            # Section header: ■ セクション名
+            if text.startswith("■ "):
+                yield heading1(text[2:].strip())
+                continue
+
+            # Sub-section header: ▸ サブセクション名
+            if text.startswith("▸ "):
+                yield heading2(text[2:].strip())
+                continue
+
+            # Regular paragraph - preserve with inline formatting
+            yield paragraph(parse_inline_formatting(text))
+
+        elif btype == "bulleted_list_item":
+            yield bullet_item(parse_inline_formatting(text))
+
+        # Skip unknown block types
+
+    if in_table:
+        tbl = make_table(table_rows)
+        if tbl:
+            yield tbl
+
+
+# ─── List Wrappers ───
+
+
+def parse_markdown(filepath):
+    """Parse a markdown file into Notion blocks."""
+    with open(filepath, "r") as f:
+        return list(iter_markdown_blocks(f))
+
+
+def parse_page_blocks(blocks):
+    """Parse raw Notion blocks into a list of new formatted blocks."""
+    return list(iter_page_blocks(blocks))
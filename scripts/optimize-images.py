@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Optimize cover images under images/: resize to a maximum size, re-encode as
+WebP in parallel, and enforce a per-file byte budget.
+
+Files whose content hash and settings are already recorded in the local
+cache (.image-cache.json) are skipped, so repeated runs don't re-encode (and
+degrade) images that were already optimized. Images larger than the maximum
+size are always resized; others are only replaced when the re-encoded image
+is smaller. Animated images are left unchanged.
+
+Exits with status 1 if any image fails to optimize or is over the byte budget.
+
+Usage:
+  python3 scripts/optimize-images.py [--dry-run] [--check] [--force]
+                                     [--max-width W] [--max-height H] [--quality Q]
+                                     [--max-bytes N] [--jobs N] [FILE ...]
+"""
+
+import os
+import sys
+import json
+import glob
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_DIR = os.path.join(REPO_ROOT, "images")
+CACHE_FILE = os.path.join(REPO_ROOT, ".image-cache.json")
+
+# Size and quality targets (Zenn cover images are 1280x720)
+MAX_WIDTH = 1280
+MAX_HEIGHT = 720
+QUALITY = 80
+MAX_BYTES = 100 * 1024  # per-file budget
+
+
+def file_hash(path):
+    """Return the sha256 hex digest of a file's content."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_cache():
+    """Load {relative path: {"hash", "max_width", "max_height", "quality"}} from the cache file."""
+    if not os.path.exists(CACHE_FILE):
+        return {}
+    with open(CACHE_FILE, "r") as f:
+        return json.load(f)
+
+
+def save_cache(cache):
+    with open(CACHE_FILE, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+# ─── Worker ───
+
+
+def optimize_image(path, max_width, max_height, quality, dry_run=False):
+    """Resize and re-encode a single image.
+
+    A resized image is always written; a same-size re-encode is only written
+    when it is smaller than the original. Animated images are skipped, since
+    only their first frame would be kept. Returns a result dict for reporting.
+    """
+    before = os.path.getsize(path)
+    tmp_path = path + ".tmp"
+    note = None
+
+    try:
+        with Image.open(path) as im:
+            orig_size = im.size
+            new_size = orig_size
+            animated = getattr(im, "is_animated", False)
+            if not animated:
+                if im.width > max_width or im.height > max_height:
+                    im.thumbnail((max_width, max_height), Image.LANCZOS)
+                new_size = im.size
+                im.save(tmp_path, "WEBP", quality=quality, method=6)
+
+        if animated:
+            after = before
+            written = False
+            note = "animated, left unchanged"
+        else:
+            after = os.path.getsize(tmp_path)
+            written = new_size != orig_size or after < before
+            if not written:
+                # Re-encoding didn't help; keep the original as is
+                after = before
+                note = "kept original, re-encoded file was not smaller"
+            elif not dry_run:
+                os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return {
+        "path": path,
+        "before": before,
+        "after": after,
+        "orig_size": orig_size,
+        "new_size": new_size,
+        "written": written,
+        "note": note,
+        "hash": file_hash(path) if not dry_run else None,
+    }
+
+
+# ─── Main Processing ───
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimize images/ and enforce a per-file byte budget")
+    parser.add_argument("files", nargs="*", help="Images to process (default: images/*.webp)")
+    parser.add_argument("--dry-run", action="store_true", help="Report savings without modifying files")
+    parser.add_argument("--check", action="store_true", help="Only check the byte budget, don't re-encode")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and re-encode every file")
+    parser.add_argument("--max-width", type=int, default=MAX_WIDTH)
+    parser.add_argument("--max-height", type=int, default=MAX_HEIGHT)
+    parser.add_argument("--quality", type=int, default=QUALITY)
+    parser.add_argument("--max-bytes", type=int, default=MAX_BYTES, help="Per-file byte budget")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(IMAGES_DIR, "*.webp")))
+    if not files:
+        print("No images found")
+        return
+
+    not_webp = [path for path in files if os.path.splitext(path)[1].lower() != ".webp"]
+    if not_webp:
+        print(f"ERROR: Only .webp images are supported: {', '.join(not_webp)}")
+        sys.exit(1)
+
+    settings = {"max_width": args.max_width, "max_height": args.max_height, "quality": args.quality}
+    cache = {} if args.force else load_cache()
+
+    todo = []
+    skip_count = 0
+    if not args.check:
+        for path in files:
+            key = os.path.relpath(os.path.abspath(path), REPO_ROOT)
+            if cache.get(key) == {"hash": file_hash(path), **settings}:
+                skip_count += 1
+            else:
+                todo.append(path)
+
+    print(f"Images: {len(files)} ({len(todo)} to optimize, {skip_count} cached)")
+    if args.dry_run:
+        print("[DRY RUN MODE]")
+
+    total_saved = 0
+    written_count = 0
+    sizes = {}
+    failed = []
+    futures = []
+    if todo:
+        try:
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                for path in todo:
+                    futures.append(
+                        pool.submit(optimize_image, path, args.max_width, args.max_height, args.quality, args.dry_run)
+                    )
+                for path, future in zip(todo, futures):
+                    try:
+                        r = future.result()
+                    except Exception as e:
+                        print(f"  {os.path.basename(path)}: FAILED ({e})")
+                        failed.append(path)
+                        continue
+                    saved = r["before"] - r["after"]
+                    total_saved += saved
+                    written_count += r["written"]
+                    sizes[path] = r["after"]
+                    dims = f"{r['orig_size'][0]}x{r['orig_size'][1]}"
+                    if r["new_size"] != r["orig_size"]:
+                        dims += f" → {r['new_size'][0]}x{r['new_size'][1]}"
+                    status = f" ({r['note']})" if r["note"] else ""
+                    print(f"  {os.path.basename(r['path'])}: {r['before']:,} → {r['after']:,} bytes, "
+                          f"saved {saved:,} ({dims}){status}")
+        finally:
+            # Leaving the pool waits for every worker, so record all finished
+            # files even if reporting was interrupted; otherwise they would be
+            # re-encoded (and degraded) again on the next run
+            if not args.dry_run:
+                for future in futures:
+                    if future.done() and not future.cancelled() and future.exception() is None:
+                        r = future.result()
+                        key = os.path.relpath(os.path.abspath(r["path"]), REPO_ROOT)
+                        cache[key] = {"hash": r["hash"], **settings}
+                save_cache(cache)
+
+    # Budget check on the resulting sizes (what a dry run would produce),
+    # falling back to the file on disk for cached or failed images
+    for path in files:
+        if path not in sizes:
+            sizes[path] = os.path.getsize(path)
+    over_budget = [(path, sizes[path]) for path in files if sizes[path] > args.max_bytes]
+
+    print(f"\n{'=' * 50}")
+    print(f"Saved {total_saved:,} bytes across {written_count} images ({len(todo)} processed)")
+    if args.dry_run:
+        print("(Dry run - no changes made)")
+    if failed:
+        print(f"Failed: {len(failed)} images")
+        for path in failed:
+            print(f"  {os.path.relpath(os.path.abspath(path), REPO_ROOT)}")
+    if over_budget:
+        print(f"Over budget ({args.max_bytes:,} bytes):")
+        for path, size in over_budget:
+            print(f"  {os.path.relpath(os.path.abspath(path), REPO_ROOT)}: {size:,} bytes")
+    if failed or over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
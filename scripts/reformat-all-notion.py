@@ -14,13 +14,14 @@ Usage:
 """
 
 import os
-import re
 import sys
 import time
 import json
 import argparse
 import requests
 
+from notion_blocks import parse_page_blocks
+
 NOTION_TOKEN = os.environ.get("NOTION_TOKEN", "")
 if not NOTION_TOKEN:
     print("ERROR: Set NOTION_TOKEN environment variable")
@@ -117,156 +118,9 @@ def append_blocks(page_id, blocks):
     return True
 
 
-# ─── Rich Text Parser ───
-
-
-def parse_inline_formatting(text_str):
-    """Parse inline markdown formatting to Notion rich text array.
-
-    Handles:
-    - `code` → code annotation
-    - [link text](url) → link
-    - Regular text
-    """
-    if not text_str or not text_str.strip():
-        return [rt_text("")]
-
-    rich_texts = []
-    # Pattern to match `code` or [text](url)
-    pattern = r'(`[^`]+`|\[[^\]]*\]\([^)]+\))'
-    parts = re.split(pattern, text_str)
-
-    for part in parts:
-        if not part:
-            continue
-        if part.startswith("`") and part.endswith("`"):
-            # Code span
-            code_content = part[1:-1]
-            rich_texts.append(rt_text(code_content, code=True))
-        elif re.match(r'\[([^\]]*)\]\(([^)]+)\)', part):
-            # Markdown link - only create link if URL is valid (http/https)
-            m = re.match(r'\[([^\]]*)\]\(([^)]+)\)', part)
-            url = m.group(2)
-            if url.startswith(("http://", "https://")):
-                rich_texts.append(rt_text(m.group(1), link=url))
-            else:
-                # Relative path or invalid URL - render as plain text
-                rich_texts.append(rt_text(m.group(1)))
-        else:
-            rich_texts.append(rt_text(part))
-
-    return rich_texts if rich_texts else [rt_text("")]
-
-
-def rt_text(content, bold=False, code=False, link=None):
-    """Create a single rich text element."""
-    rt = {"type": "text", "text": {"content": content}}
-    if link:
-        rt["text"]["link"] = {"url": link}
-    annotations = {}
-    if bold:
-        annotations["bold"] = True
-    if code:
-        annotations["code"] = True
-    if annotations:
-        rt["annotations"] = annotations
-    return rt
-
-
-# ─── Block Builders ───
-
-
-def heading1(title):
-    return {"type": "heading_1", "heading_1": {"rich_text": [rt_text(title)]}}
-
-
-def heading2(title):
-    return {"type": "heading_2", "heading_2": {"rich_text": [rt_text(title)]}}
-
-
-def heading3(title):
-    return {"type": "heading_3", "heading_3": {"rich_text": [rt_text(title)]}}
-
-
-def divider():
-    return {"type": "divider", "divider": {}}
-
-
-def paragraph(rich_texts):
-    return {"type": "paragraph", "paragraph": {"rich_text": rich_texts}}
-
-
-def empty_paragraph():
-    return {"type": "paragraph", "paragraph": {"rich_text": []}}
-
-
-def bullet_item(rich_texts):
-    return {"type": "bulleted_list_item", "bulleted_list_item": {"rich_text": rich_texts}}
-
-
-def make_table(rows):
-    """Create a table block from parsed rows.
-    Each row is a list of cell strings (raw markdown text).
-    First row is treated as header.
-    """
-    if not rows or len(rows) < 1:
-        return None
-
-    width = len(rows[0])
-    table_rows = []
-    for row in rows:
-        cells = []
-        for cell_text in row:
-            cell_text = cell_text.strip()
-            rich_texts = parse_inline_formatting(cell_text)
-            cells.append(rich_texts)
-        # Pad or trim to match width
-        while len(cells) < width:
-            cells.append([rt_text("")])
-        cells = cells[:width]
-        table_rows.append({"type": "table_row", "table_row": {"cells": cells}})
-
-    return {
-        "type": "table",
-        "table": {
-            "table_width": width,
-            "has_column_header": True,
-            "has_row_header": False,
-            "children": table_rows,
-        },
-    }
-
-
 # ─── Content Parser ───
 
 
-def extract_plain_text(block):
-    """Extract plain text from a block's rich_text array."""
-    btype = block["type"]
-    rt_list = block.get(btype, {}).get("rich_text", [])
-    return "".join(t.get("plain_text", "") for t in rt_list)
-
-
-def parse_table_row(line):
-    """Parse a markdown table row '| col1 | col2 | col3 |' into list of cell strings."""
-    line = line.strip()
-    if not line.startswith("|"):
-        return None
-    # Split by |, remove first/last empty elements
-    parts = line.split("|")
-    # Remove leading/trailing empty strings from split
-    if parts and parts[0].strip() == "":
-        parts = parts[1:]
-    if parts and parts[-1].strip() == "":
-        parts = parts[:-1]
-    return [p.strip() for p in parts]
-
-
-def is_separator_row(cells):
-    """Check if a row is a markdown table separator (| --- | --- |)."""
-    return all(re.match(r'^:?-+:?$', c.strip()) for c in cells if c.strip())
-
-
 def is_already_reformatted(blocks):
     """Check if a page has already been reformatted (contains native heading/table blocks)."""
     for b in blocks:
@@ -275,92 +129,6 @@ def is_already_reformatted(blocks):
     return False
 
 
-def parse_page_blocks(blocks):
-    """Parse raw Notion blocks into a list of new formatted blocks."""
-    new_blocks = []
-    i = 0
-
-    while i < len(blocks):
-        block = blocks[i]
-        btype = block["type"]
-
-        if btype == "paragraph":
-            text = extract_plain_text(block)
-
-            # Skip empty paragraphs
-            if not text.strip():
-                i += 1
-                continue
-
-            # Decorative title: ━━━ タイトル ━━━
-            if "━━━" in text:
-                i += 1
-                continue
-
-            # Horizontal rule: ---
-            if text.strip() == "---":
-                new_blocks.append(divider())
-                i += 1
-                continue
-
-            # Section header: ■ セクション名
-            if text.startswith("■ "):
-                section_name = text[2:].strip()
-                new_blocks.append(heading1(section_name))
-                i += 1
-                continue
-
-            # Sub-section header: ▸ サブセクション名
-            if text.startswith("▸ "):
-                subsection_name = text[2:].strip()
-                new_blocks.append(heading2(subsection_name))
-                i += 1
-                continue
-
-            # Markdown table row
-            if text.strip().startswith("|"):
-                table_rows = []
-                while i < len(blocks):
-                    b = blocks[i]
-                    if b["type"] != "paragraph":
-                        break
-                    t = extract_plain_text(b)
-                    if not t.strip().startswith("|"):
-                        break
-                    cells = parse_table_row(t)
-                    if cells is None:
-                        break
-                    if not is_separator_row(cells):
-                        table_rows.append(cells)
-                    i += 1
-
-                if table_rows:
-                    tbl = make_table(table_rows)
-                    if tbl:
-                        new_blocks.append(tbl)
-                continue
-
-            # Regular paragraph - preserve with inline formatting
-            rich_texts = parse_inline_formatting(text)
-            new_blocks.append(paragraph(rich_texts))
-            i += 1
-            continue
-
-        elif btype == "bulleted_list_item":
-            text = extract_plain_text(block)
-            rich_texts = parse_inline_formatting(text)
-            new_blocks.append(bullet_item(rich_texts))
-            i += 1
-            continue
-
-        else:
-            # Skip unknown block types
-            i += 1
-            continue
-
-    return new_blocks
-
-
 # ─── Main Processing ───
 
 